@@ -1,4 +1,5 @@
 import warnings
+from functools import lru_cache
 
 import astropy.units as u
 import numpy as np
@@ -48,6 +49,18 @@ def image_gaia_query(
     return table
 
 
+@lru_cache(maxsize=64)
+def _tic_query(ra, dec, radius):
+    # keyed on plain floats (degrees) so repeated queries of the same field
+    # within a batch hit the network only once
+    return Catalogs.query_region(
+        SkyCoord(ra, dec, unit="deg"),
+        radius=radius * u.deg,
+        catalog="TIC",
+        verbose=False,
+    )
+
+
 class _CatalogBlock(Block):
     def __init__(self, name, mode: str = None, limit=10000, **kwargs):
         super().__init__(**kwargs)
@@ -305,9 +318,9 @@ class TESSCatalog(_CatalogBlock):
 
     def get_catalog(self, image):
         max_fov = image.fov.max() * np.sqrt(2) / 2
-        table = Catalogs.query_region(
-            image.skycoord, radius=max_fov, catalog="TIC", verbose=False
-        )
+        table = _tic_query(
+            image.skycoord.ra.deg, image.skycoord.dec.deg, max_fov.to(u.deg).value
+        ).copy()
         table["ra"].unit = "deg"
         table["dec"].unit = "deg"
         table.rename_column("ID", "id")
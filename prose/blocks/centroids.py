@@ -212,7 +212,9 @@ class CentroidBallet(_CNNCentroid):
             from tensorflow.keras.layers import Conv2D, Dense, Flatten, MaxPooling2D
             from tensorflow.keras.models import Sequential
         except ModuleNotFoundError:
-            TF_LOADED = True
+            raise ImportError(
+                "tensorflow is required for this block (pip install tensorflow)"
+            )
 
         self.model = Sequential(
             [
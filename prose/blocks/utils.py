@@ -8,7 +8,50 @@ from astropy.io import fits
 from prose.console_utils import info
 from prose.core import Block, FITSImage, Image, Sources
 from prose.fluxes import Fluxes
-from prose.utils import easy_median
+from prose.utils import divisors
+
+try:
+    from numba import njit
+
+    # parallel=True is deliberately avoided: it starts numba's threading
+    # layer, which is not fork-safe and would deadlock the multiprocess
+    # pools used by Sequence and SequenceParallel
+    @njit(cache=True)
+    def _median_axis0(cube, out):
+        # quickselect-based median over the stack axis (O(N) per pixel
+        # instead of a full sort), NaN-aware like np.nanmedian
+        n, h, w = cube.shape
+        buf = np.empty(n, dtype=cube.dtype)
+        for i in range(h):
+            for j in range(w):
+                m = 0
+                for s in range(n):
+                    value = cube[s, i, j]
+                    if not np.isnan(value):
+                        buf[m] = value
+                        m += 1
+                if m == 0:
+                    out[i, j] = np.nan
+                    continue
+                k = m // 2
+                part = np.partition(buf[:m], k)
+                if m % 2:
+                    out[i, j] = part[k]
+                else:
+                    out[i, j] = 0.5 * (np.max(part[:k]) + part[k])
+
+except ModuleNotFoundError:
+    _median_axis0 = None
+
+
+def _stack_median(stack):
+    # stack is an owned cube (n, h, w): the median can work in place
+    if _median_axis0 is not None:
+        out = np.empty(stack.shape[1:], dtype=stack.dtype)
+        _median_axis0(stack, out)
+        return out
+    return np.nanmedian(stack, axis=0, overwrite_input=True)
+
 
 __all__ = [
     "LimitSources",
@@ -240,6 +283,15 @@ class Calibration(Block):
         self.master_dark = self._produce_master(check_input(darks), "dark")
         self.master_flat = self._produce_master(check_input(flats), "flat")
 
+        self._dark_plus_bias = None
+        self._dark_bias_exp_time = None
+
+        # division is several times slower than multiplication, so flats are
+        # applied as a multiplication by the reciprocal (zeros become inf,
+        # mapped to -1 in run() as with the former division)
+        with np.errstate(divide="ignore"):
+            self._inv_master_flat = np.reciprocal(self.master_flat)
+
         if shared:
             self._share()
         self.verbose = verbose
@@ -255,12 +307,6 @@ class Calibration(Block):
             if len(images) == 0:
                 images = None
 
-        def _median(im):
-            if self.easy_ram:
-                return easy_median(im)
-            else:
-                return np.median(im, 0)
-
         def _get_data_exposure(image):
             if isinstance(image, (str, Path)):
                 image = self.loader(image)
@@ -280,7 +326,8 @@ class Calibration(Block):
 
             return image_data, image_exposure
 
-        _master = []
+        strips = None
+        cube = None
 
         if images is None:
             if self.verbose:
@@ -295,25 +342,72 @@ class Calibration(Block):
             if self.verbose:
                 info(f"Building master {image_type}")
 
-            for image in images:
+            for i, image in enumerate(images):
                 image_data, image_exposure = _get_data_exposure(image)
                 if image_type == "bias":
-                    _master.append(image_data)
+                    # frames are written into a preallocated cube instead of a
+                    # list, avoiding a per-frame allocation and the final stack
+                    if cube is None:
+                        cube = np.empty(
+                            (len(images), *image_data.shape), dtype=np.float32
+                        )
+                    cube[i] = image_data
                 elif image_type == "dark":
-                    _dark = (image_data - self.master_bias) / image_exposure
-                    _master.append(_dark)
+                    if cube is None:
+                        cube = np.empty(
+                            (len(images), *image_data.shape), dtype=np.float32
+                        )
+                    np.subtract(image_data, self.master_bias, out=cube[i])
+                    cube[i] /= image_exposure
                 elif image_type == "flat":
                     _flat = (
                         image_data
                         - self.master_bias
                         - self.master_dark * image_exposure
-                    )
+                    ).astype(np.float32)
                     _flat /= np.mean(_flat)
-                    _master.append(_flat)
+                    if self.easy_ram:
+                        # stream each flat into row-strip buffers so the full
+                        # (N, H, W) cube is never materialized (same split in
+                        # 50 as easy_median)
+                        if strips is None:
+                            shape_divisors = divisors(_flat.shape[0])
+                            n = shape_divisors[np.argmin(np.abs(50 - shape_divisors))]
+                            h = _flat.shape[0] // n
+                            strips = [
+                                np.empty(
+                                    (len(images), h, _flat.shape[1]),
+                                    dtype=np.float32,
+                                )
+                                for _ in range(n)
+                            ]
+                        for k in range(n):
+                            strips[k][i] = _flat[k * h : (k + 1) * h]
+                    else:
+                        # indexed assignment into a preallocated cube skips
+                        # the list append + np.array conversion copy
+                        if cube is None:
+                            cube = np.empty(
+                                (len(images), *_flat.shape), dtype=np.float32
+                            )
+                        cube[i] = _flat
                     del image_data
 
-            if len(_master) > 0:
-                master = _median(_master)
+            if strips is not None:
+                master = np.concatenate([_stack_median(s) for s in strips])
+                del strips
+            elif cube is not None:
+                if self.easy_ram:
+                    # same split in 50 as easy_median, but on views of the
+                    # cube rather than copies
+                    shape_divisors = divisors(cube.shape[1])
+                    n = shape_divisors[np.argmin(np.abs(50 - shape_divisors))]
+                    master = np.concatenate(
+                        [_stack_median(s) for s in np.split(cube, n, axis=1)]
+                    )
+                else:
+                    master = _stack_median(cube)
+                del cube
             else:
                 master = None
 
@@ -335,10 +429,16 @@ class Calibration(Block):
             return (image - (dark * exp_time + bias)) / flat
 
     def _calibration(self, image, exp_time):
+        # master_dark * exp_time + master_bias is constant across a sequence
+        # with fixed exposure, so cache it and fall back to in-place ops to
+        # avoid allocating full-frame temporaries on every image
+        if exp_time != self._dark_bias_exp_time:
+            self._dark_plus_bias = self.master_dark * exp_time + self.master_bias
+            self._dark_bias_exp_time = exp_time
         with np.errstate(divide="ignore", invalid="ignore"):
-            return (
-                image - (self.master_dark * exp_time + self.master_bias)
-            ) / self.master_flat
+            calibrated = image - self._dark_plus_bias
+            calibrated *= self._inv_master_flat
+            return calibrated
 
     def run(self, image):
         data = image.data
@@ -410,7 +510,7 @@ class CleanBadPixels(Block):
                 for flat in flats:
                     data = self.loader(flat).data
                     _flats.append(data / np.mean(data))
-                master_flat = easy_median(_flats)
+                master_flat = _stack_median(np.stack(_flats))
                 master_flat = self.clean(master_flat)
                 bad_flats = np.where(master_flat < min_flat)
                 if len(bad_flats) == 2:
@@ -665,4 +765,4 @@ class SelectiveStack(Block):
                 self._images[i] = image
 
     def terminate(self):
-        self.stack = Image(easy_median([im.data for im in self._images]))
+        self.stack = Image(_stack_median(np.stack([im.data for im in self._images])))
@@ -1,5 +1,5 @@
 import pickle
-from copy import deepcopy
+from copy import copy, deepcopy
 from dataclasses import asdict, dataclass
 from datetime import timedelta
 from pathlib import Path
@@ -24,6 +24,11 @@ from prose import utils, viz
 from prose.core.source import Sources
 from prose.telescope import Telescope
 
+try:
+    import fitsio
+except ModuleNotFoundError:
+    fitsio = None
+
 
 @dataclass
 class Image:
@@ -81,7 +86,11 @@ class Image:
             self._sources = Sources([])
 
     def __setattr__(self, name, value):
-        if hasattr(self, name):
+        # checking the class (fields, properties and class attributes) rather
+        # than hasattr(self, name) avoids triggering __getattr__ and its
+        # AttributeError on every new computed value, a hot path when blocks
+        # set many attributes per image
+        if name in self.__dict__ or hasattr(type(self), name):
             super().__setattr__(name, value)
         else:
             if "computed" in self.__dict__:
@@ -101,6 +110,11 @@ class Image:
     def copy(self, data=True):
         """Copy of image object
 
+        Pixel data is copied and the metadata, computed and catalogs
+        dictionaries are rebuilt with one-level copies of their values, which
+        avoids the recursive deepcopy of the whole object (see
+        :py:meth:`Image.deep_copy` for a full recursive copy).
+
         Parameters
         ----------
         data : bool, optional
@@ -111,9 +125,32 @@ class Image:
         Image
             copied object
         """
-        new_self = deepcopy(self)
+        new_self = self.__class__(
+            data=self.data.copy() if data and self.data is not None else None,
+            metadata=self.metadata.copy(),
+            catalogs={name: copy(catalog) for name, catalog in self.catalogs.items()},
+            origin=self.origin,
+            discard=self.discard,
+            computed={name: copy(value) for name, value in self.computed.items()},
+            header=self.header.copy() if self.header is not None else None,
+        )
+        new_self._sources = self._sources.copy()
+        if self._wcs is not None:
+            # carry over an explicitly set WCS (e.g. on cutouts, whose header
+            # does not hold one)
+            new_self._wcs = copy(self._wcs)
         return new_self
 
+    def deep_copy(self):
+        """Full recursive copy of the image object
+
+        Returns
+        -------
+        Image
+            copied object
+        """
+        return deepcopy(self)
+
     def __copy__(self):
         return self.copy()
 
@@ -175,7 +212,9 @@ class Image:
                 ax = fig.add_subplot(111)
 
         if zscale is False:
-            vmin = np.nanmedian(self.data)
+            # a strided subsample is enough to estimate the display median
+            # and touches 64x less data
+            vmin = np.nanmedian(self.data[::8, ::8])
             vmax = vmax = vmin * (1 + contrast) / (1 - contrast)
             _ = ax.imshow(
                 self.data, cmap=cmap, origin="lower", vmin=vmin, vmax=vmax, **kwargs
@@ -197,7 +236,6 @@ class Image:
 
         ax.set_xlim(0, self.shape[1] - 1)
         ax.set_ylim(0, self.shape[0] - 1)
-        self._wcs = None
 
     def _from_metadata_with_unit(self, name):
         unit_name = f"{name}_unit"
@@ -396,16 +434,25 @@ class Image:
                 )
                 _sources = self._sources[sources_in]
 
-                for s in _sources:
+                # translate all coordinates in a single vectorized operation
+                # rather than one small array subtraction per source
+                new_coords = _sources.coords - [x0, y0]
+                for s, c in zip(_sources, new_coords):
                     _s = s.copy()
-                    _s.coords = _s.coords - [x0, y0]
+                    _s.coords = c
                     new_sources.append(_s)
 
-        image = Image(new_image.data, deepcopy(self.metadata), deepcopy(self.computed))
+        # same one-level copies as Image.copy: metadata values are read-only
+        # scalars and pandas catalogs copy themselves, so no recursive
+        # deepcopy is needed
+        image = Image(
+            new_image.data,
+            self.metadata.copy(),
+            {name: copy(catalog) for name, catalog in self.catalogs.items()},
+        )
         image._sources = Sources(new_sources)
         image.wcs = new_image.wcs
         image.origin = tuple(np.array(new_image.bbox_original).T[0][::-1])
-        image.catalogs = deepcopy(self.catalogs)
         for name, catalog in image.catalogs.items():
             image.catalogs[name][["x", "y"]] -= coords - np.array(shape) / 2
             # xy = catalog[["x", "y"]].values
@@ -422,14 +469,21 @@ class Image:
     def wcs(self):
         """astropy.wcs.WCS object associated with the FITS ``Image.header``."""
         if self._wcs is None:
-            self._wcs = WCS(self.metadata.get("wcs", None))
+            if "wcs" in self.metadata:
+                self._wcs = WCS(self.metadata["wcs"])
+            else:
+                # parsed from the FITS header on first access, so that
+                # pipelines not using astrometry never pay for it
+                self._wcs = WCS(self.header)
         return self._wcs
 
     @wcs.setter
     def wcs(self, new_wcs):
         if new_wcs is not None:
             if isinstance(new_wcs, WCS):
-                self.metadata["wcs"] = new_wcs.to_header().tostring()
+                # the object is kept as is: serializing to a header string on
+                # every set (and parsing it back on get) is only needed for
+                # dict exports, where asdict fills metadata["wcs"] lazily
                 self._wcs = new_wcs
 
     @property
@@ -525,7 +579,12 @@ class Image:
         axr.axis("off")
 
     def asdict(self, image_dtype="int16", low_data=True):
-        im_dict = asdict(self.copy())
+        new_self = self.copy()
+        if self._wcs is not None:
+            # the WCS object is not a dataclass field: serialize it here so
+            # that dict exports (and Image.save) round-trip
+            new_self.metadata["wcs"] = self._wcs.to_header().tostring()
+        im_dict = asdict(new_self)
         if low_data:
             im_dict["data"] = utils.z_scale(im_dict["data"]) * (2**7 - 1)
             image_dtype = "int8"
@@ -635,11 +694,14 @@ class Image:
         distances = np.sum((p3 - p1) * (p2 - p1), 0) / np.sqrt(l2)
         flat_distance = distances.flatten()
         idxs = utils.index_binning(flat_distance, binn)
+        # flattened once: the comprehension previously copied the full frame
+        # on every bin
+        flat_data = self.data.ravel()
         distance = np.array([flat_distance[i].mean() for i in idxs])
-        values = np.array([np.nanmax(self.data.flatten()[i]) for i in idxs])
+        values = np.array([np.nanmax(flat_data[i]) for i in idxs])
 
         if debug:
-            D = np.zeros(self.data.flatten().shape)
+            D = np.zeros(flat_data.shape)
             for i, j in enumerate(idxs):
                 D[j] = i
             plt.figure()
@@ -674,6 +736,59 @@ def str_to_astropy_unit(unit_string):
     return u.__dict__[unit_string]
 
 
+def _read_fits(filepath, load_data=True):
+    """Read primary HDU data and header from a FITS file.
+
+    Uses fitsio (cfitsio) when installed, which is noticeably faster than
+    astropy.io.fits when opening many files, and falls back to astropy
+    otherwise.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        path of the FITS file
+    load_data : bool, optional
+        whether to load image data, by default True
+
+    Returns
+    -------
+    tuple
+        (data or None, astropy.io.fits.header.Header)
+    """
+    if fitsio is not None:
+        with fitsio.FITS(str(filepath)) as f:
+            # like astropy's fits.getdata, fall through to the first HDU
+            # containing data (the primary HDU is empty in multi-extension
+            # and tile-compressed files)
+            hdu = f[0]
+            for _hdu in f:
+                if _hdu.has_data():
+                    hdu = _hdu
+                    break
+            values = hdu.read().astype(np.float32, copy=False) if load_data else None
+            header = Header()
+            for record in hdu.read_header().records():
+                name = record["name"]
+                if name is None or name in ("COMMENT", "HISTORY", "CONTINUE"):
+                    continue
+                header[name] = (record["value"], record.get("comment", ""))
+    else:
+        # a single open serves both data and header, where getdata + getheader
+        # would open and parse the file twice
+        with fits.open(filepath, memmap=True) as hdul:
+            # hdu.size comes from the header, so this scan does not touch
+            # pixel data
+            hdu = hdul[0]
+            for _hdu in hdul:
+                if _hdu.size > 0:
+                    hdu = _hdu
+                    break
+            values = hdu.data.astype(np.float32, copy=False) if load_data else None
+            header = hdu.header
+
+    return values, header
+
+
 def FITSImage(
     filepath_or_hdu: Union[str, Path, _BaseHDU],
     verbose: bool = False,
@@ -695,15 +810,15 @@ def FITSImage(
     load_data : bool, optional
         whether to load image data, by default True
     skip_wcs : bool, optional
-        whether to skip WCS loading, by default False
+        deprecated, the WCS is now lazily built from the header on first
+        :py:attr:`Image.wcs` access, by default False
 
     Returns
     -------
     :py:class:`~prose.Image`
     """
     if isinstance(filepath_or_hdu, (str, Path)):
-        values = fits.getdata(filepath_or_hdu).astype(float) if load_data else None
-        header = fits.getheader(filepath_or_hdu)
+        values, header = _read_fits(filepath_or_hdu, load_data=load_data)
         path = filepath_or_hdu
     elif issubclass(type(filepath_or_hdu), _BaseHDU):
         values = filepath_or_hdu.data
@@ -750,8 +865,8 @@ def FITSImage(
     if image.metadata["jd"] is None:
         image.metadata["jd"] = Time(image.date).jd
     image.header = header
-    if not skip_wcs:
-        image.wcs = WCS(header)
+    # the WCS is built lazily from the header on first Image.wcs access, so
+    # nothing is parsed here (skip_wcs is kept for backward compatibility)
     image.telescope = telescope
 
     return image
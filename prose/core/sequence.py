@@ -1,5 +1,4 @@
 import sys
-from collections import OrderedDict
 from functools import partial
 from pathlib import Path
 
@@ -60,18 +59,20 @@ class Sequence:
 
     @blocks.setter
     def blocks(self, blocks):
-        self.blocks_dict = OrderedDict(
-            {
-                block.name if block.name is not None else "block{}".format(i): block
-                for i, block in enumerate(blocks)
-            }
-        )
+        # a plain dict preserves insertion order since Python 3.7, so the
+        # OrderedDict wrapper only added a second pass over the keys
+        self.blocks_dict = {
+            block.name if block.name is not None else "block{}".format(i): block
+            for i, block in enumerate(blocks)
+        }
 
     def _set_blocks_in_sequence(self, in_sequence):
         for b in self.blocks:
             b.in_sequence = in_sequence
 
-    def run(self, images, terminate=True, show_progress=True, loader=FITSImage):
+    def run(
+        self, images, terminate=True, show_progress=True, loader=FITSImage, n_jobs=1
+    ):
         """Run the sequence
 
         Parameters
@@ -84,6 +85,10 @@ class Sequence:
             whether to show a progress bar, by default True
         loader : Image sub-class, optional
             An Image sub-class to load images path(s) of provided as inputs, by default py:class:`Image`
+        n_jobs : int, optional
+            number of processes images are distributed over, by default 1 (serial).
+            As in :py:class:`SequenceParallel`, blocks holding data must not be
+            run this way as their state is local to each process
         """
         self._set_blocks_in_sequence(True)
         self.images = images if not isinstance(images, (str, Path, Image)) else [images]
@@ -107,7 +112,10 @@ class Sequence:
         # run
         self.n_processed_images = 0
         self.discards = {}
-        self._run(loader=loader)
+        if n_jobs > 1:
+            self._run_parallel(loader=loader, n_jobs=n_jobs)
+        else:
+            self._run(loader=loader)
 
         for block_name, discarded in self.discards.items():
             warning(
@@ -139,6 +147,43 @@ class Sequence:
 
             self.n_processed_images += 1
 
+    def check_data_blocks(self):
+        bad_blocks = []
+        for b in self.blocks:
+            if b._data_block:
+                bad_blocks.append(f"{b.__class__.__name__}")
+        if len(bad_blocks) > 0:
+            bad_blocks = ", ".join(list(np.unique(bad_blocks)))
+            error(
+                f"Data blocks [{bad_blocks}] cannot be run in parallel\n\nConsider using the data_blocks kwargs of SequenceParallel"
+            )
+            sys.exit()
+
+    def _run_parallel(self, loader=FITSImage, n_jobs=2):
+        self.check_data_blocks()
+        assert (
+            np.max([block.size for block in self.blocks]) == 1
+        ), "blocks processing more than one image cannot be run in parallel"
+
+        n = len(self.images)
+        images_i = list(enumerate(self.images))
+        # chunks amortize inter-process communication
+        chunksize = max(1, n // (4 * n_jobs))
+
+        with mp.Pool(n_jobs, initializer=_init_worker, initargs=(self.blocks,)) as pool:
+            for image in self.progress(
+                pool.imap(
+                    partial(_run_all_worker, loader=loader),
+                    images_i,
+                    chunksize=chunksize,
+                ),
+                total=n,
+            ):
+                self.last_image = image
+                if image.discard:
+                    self._add_discard(image.discard_block, image.i)
+                self.n_processed_images += 1
+
     def terminate(self):
         """Run the :py:class:`Block.terminate` method of all blocks"""
         for block in self.blocks:
@@ -268,31 +313,16 @@ class SequenceParallel(Sequence):
             self.data = Sequence(data_blocks)
             self._has_data = True
 
-    def check_data_blocks(self):
-        bad_blocks = []
-        for b in self.blocks:
-            if b._data_block:
-                bad_blocks.append(f"{b.__class__.__name__}")
-        if len(bad_blocks) > 0:
-            bad_blocks = ", ".join(list(np.unique(bad_blocks)))
-            error(
-                f"Data blocks [{bad_blocks}] cannot be used in MPSequence\n\nConsider using the data_blocks kwargs"
-            )
-            sys.exit()
-
     def _run(self, loader=FITSImage):
         self.check_data_blocks()
 
         self.n_processed_images = 0
         n = len(self.images)
-        processed_blocks = mp.Manager().list(self.blocks)
         images_i = list(enumerate(self.images))
 
-        with mp.Pool() as pool:
+        with mp.Pool(initializer=_init_worker, initargs=(self.blocks,)) as pool:
             for image in self.progress(
-                pool.imap(
-                    partial(_run_all, blocks=processed_blocks, loader=loader), images_i
-                ),
+                pool.imap(partial(_run_all_worker, loader=loader), images_i),
                 total=n,
             ):
                 if not image.discard:
@@ -306,6 +336,21 @@ class SequenceParallel(Sequence):
             self.data.terminate()
 
 
+# blocks are sent once per worker through the pool initializer and kept
+# resident in worker memory, rather than behind a Manager proxy whose every
+# attribute access is a pickle + IPC round trip
+_worker_blocks = None
+
+
+def _init_worker(blocks):
+    global _worker_blocks
+    _worker_blocks = blocks
+
+
+def _run_all_worker(image_i, loader=None):
+    return _run_all(image_i, blocks=_worker_blocks, loader=loader)
+
+
 def _run_all(image_i, blocks=None, loader=None):
     i, image = image_i
 
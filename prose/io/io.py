@@ -12,6 +12,29 @@ from astropy.time import Time
 from prose.console_utils import progress, warning
 from prose.telescope import Telescope
 
+try:
+    import fitsio
+except ModuleNotFoundError:
+    fitsio = None
+
+
+def _get_header(filepath, hdu=0):
+    """Read a FITS header without touching pixel data.
+
+    Goes through fitsio (cfitsio) when installed, which parses headers
+    noticeably faster than astropy when scanning thousands of files.
+    """
+    if fitsio is not None:
+        fitsio_header = fitsio.read_header(str(filepath), ext=hdu)
+        header = fits.Header()
+        for record in fitsio_header.records():
+            name = record["name"]
+            if name is None or name in ("COMMENT", "HISTORY", "CONTINUE"):
+                continue
+            header[name] = (record["value"], record.get("comment", ""))
+        return header
+    return fits.getheader(filepath, hdu)
+
 
 def phot2dict(filename):
     hdu = fits.open(filename)
@@ -133,11 +156,27 @@ def fits_to_df(
     last_telescope = "_"
     telescopes_seen = []
     _telescope = None
-    df_list = []
+    # columns are accumulated directly instead of one dict per file, which
+    # pandas would have to pivot row by row
+    columns_dict = {
+        name: []
+        for name in (
+            "path",
+            "date",
+            "telescope",
+            "type",
+            "target",
+            "filter",
+            "dimensions",
+            "flip",
+            "jd",
+            "exposure",
+        )
+    }
 
     for i in progress(verbose, desc="Parsing FITS")(files):
         try:
-            header = fits.getheader(i, hdu)
+            header = _get_header(i, hdu)
         except OSError as err:
             if verbose_os:
                 warning(f"OS error for file {i}")
@@ -166,36 +205,22 @@ def fits_to_df(
         else:
             _telescope = telescope
 
-        df_list.append(
-            dict(
-                path=i,
-                date=_telescope.date(header),
-                telescope=_telescope.name,
-                type=_telescope.image_type(header),
-                target=header.get(_telescope.keyword_object, ""),
-                filter=header.get(_telescope.keyword_filter, ""),
-                dimensions=(header.get("NAXIS1", 1), header.get("NAXIS2", 1)),
-                flip=header.get(_telescope.keyword_flip, ""),
-                jd=header.get(_telescope.keyword_jd, ""),
-                exposure=float(header.get(_telescope.keyword_exposure_time, -1)),
-            )
+        columns_dict["path"].append(i)
+        columns_dict["date"].append(_telescope.date(header))
+        columns_dict["telescope"].append(_telescope.name)
+        columns_dict["type"].append(_telescope.image_type(header))
+        columns_dict["target"].append(header.get(_telescope.keyword_object, ""))
+        columns_dict["filter"].append(header.get(_telescope.keyword_filter, ""))
+        columns_dict["dimensions"].append(
+            (header.get("NAXIS1", 1), header.get("NAXIS2", 1))
+        )
+        columns_dict["flip"].append(header.get(_telescope.keyword_flip, ""))
+        columns_dict["jd"].append(header.get(_telescope.keyword_jd, ""))
+        columns_dict["exposure"].append(
+            float(header.get(_telescope.keyword_exposure_time, -1))
         )
 
-    df = pd.DataFrame(
-        df_list,
-        columns=(
-            "path",
-            "date",
-            "telescope",
-            "type",
-            "target",
-            "filter",
-            "dimensions",
-            "flip",
-            "jd",
-            "exposure",
-        ),
-    )
+    df = pd.DataFrame(columns_dict)
 
     if len(df) > 0 and _telescope is not None:
         df.type.loc[
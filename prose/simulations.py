@@ -239,7 +239,9 @@ class ObservationSimulation:
         )
         self.remove_stars(close_by)
 
-    def save_fits(self, destination, calibration=False, verbose=True, **kwargs):
+    def save_fits(
+        self, destination, calibration=False, verbose=True, n_jobs=1, **kwargs
+    ):
         progress = lambda x: tqdm(x) if verbose else x
 
         with warnings.catch_warnings():
@@ -248,22 +250,41 @@ class ObservationSimulation:
         if not path.exists(destination):
             os.makedirs(destination)
 
-        for i, time in enumerate(progress(self.time)):
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                date = Time(time, format="jd", scale="utc").to_value("fits")
-                im = self.image(i, 300)
-                fits_image(
-                    im,
-                    {
-                        "TELESCOP": self.telescope.name,
-                        "JD": time,
-                        "DATE-OBS": date,
-                        "FILTER": "a",
-                    },
-                    path.join(destination, f"fake-im-{i}.fits"),
-                    **kwargs,
-                )
+        if n_jobs > 1:
+            # frames are independent NumPy work + I/O, so they can be fanned
+            # out over processes (same worker-initializer pattern as Sequence)
+            import multiprocess as mp
+
+            with mp.Pool(
+                n_jobs,
+                initializer=_init_simulation_worker,
+                initargs=(self, destination, kwargs),
+            ) as pool:
+                for _ in progress(
+                    pool.imap_unordered(_save_one_image, list(enumerate(self.time)))
+                ):
+                    pass
+            i = len(self.time) - 1
+            time = self.time[-1]
+            date = Time(time, format="jd", scale="utc").to_value("fits")
+            im = self.image(i, 300) if calibration else None
+        else:
+            for i, time in enumerate(progress(self.time)):
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    date = Time(time, format="jd", scale="utc").to_value("fits")
+                    im = self.image(i, 300)
+                    fits_image(
+                        im,
+                        {
+                            "TELESCOP": self.telescope.name,
+                            "JD": time,
+                            "DATE-OBS": date,
+                            "FILTER": "a",
+                        },
+                        path.join(destination, f"fake-im-{i}.fits"),
+                        **kwargs,
+                    )
 
         if calibration:
             fits_image(
@@ -305,6 +326,33 @@ class ObservationSimulation:
                 )
 
 
+_simulation_worker_args = None
+
+
+def _init_simulation_worker(simulation, destination, kwargs):
+    global _simulation_worker_args
+    _simulation_worker_args = (simulation, destination, kwargs)
+
+
+def _save_one_image(i_time):
+    i, time = i_time
+    simulation, destination, kwargs = _simulation_worker_args
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        date = Time(time, format="jd", scale="utc").to_value("fits")
+        fits_image(
+            simulation.image(i, 300),
+            {
+                "TELESCOP": simulation.telescope.name,
+                "JD": time,
+                "DATE-OBS": date,
+                "FILTER": "a",
+            },
+            path.join(destination, f"fake-im-{i}.fits"),
+            **kwargs,
+        )
+
+
 def xo_lightcurve(time, period=3, r=0.1, t0=0, plot=False):
     import exoplanet as xo
 
@@ -41,6 +41,11 @@ def plot(
 def plot_marginal_model(data, model, cmap="inferno", c="blueviolet"):
     x, y = np.indices(data.shape)
 
+    # each reduction is computed once and reused by the plot and its limits
+    data_min = data.min()
+    data_mean_x = np.mean(data, axis=0)
+    data_mean_y = np.mean(data, axis=1)
+
     plt.subplot(131)
     plt.imshow(utils.z_scale(data), alpha=1, cmap=cmap)
     plt.contour(model, colors="w", alpha=0.7)
@@ -49,18 +54,18 @@ def plot_marginal_model(data, model, cmap="inferno", c="blueviolet"):
     plt.title("PSF", loc="left")
 
     plt.subplot(132)
-    plt.plot(y[0], np.mean(data, axis=0), c=c)
+    plt.plot(y[0], data_mean_x, c=c)
     plt.plot(y[0], np.mean(model, axis=0), "--", c="k")
     plt.xlabel("x (pixels)")
-    plt.ylim(data.min() * 0.98, np.mean(data, axis=0).max() * 1.02)
+    plt.ylim(data_min * 0.98, data_mean_x.max() * 1.02)
     plt.title("PSF x-axis projected", loc="left")
     plt.grid(color="whitesmoke")
 
     plt.subplot(133)
-    plt.plot(y[0], np.mean(data, axis=1), c=c)
+    plt.plot(y[0], data_mean_y, c=c)
     plt.plot(y[0], np.mean(model, axis=1), "--", c="k")
     plt.xlabel("y")
-    plt.ylim(data.min() * 0.98, np.mean(data, axis=1).max() * 1.02)
+    plt.ylim(data_min * 0.98, data_mean_y.max() * 1.02)
     plt.title("PSF y-axis projected", loc="left")
     plt.grid(color="whitesmoke")
     plt.tight_layout()
@@ -196,6 +196,32 @@ def test_Calibration_with_arrays():
     Calibration(bias=np.array([], dtype=object), flats=[], darks=observed_dark).run(im)
 
 
+def test_CleanBadPixels_with_flats():
+    im = image.copy()
+    shape = im.shape
+    rng = np.random.default_rng(42)
+
+    darks = [rng.normal(0.0, 1.0, shape) for _ in range(3)]
+    flats = [np.ones(shape) * level for level in (0.9, 1.0, 1.1)]
+    for flat in flats:
+        flat[5, 5] = 1e-3
+
+    block = blocks.CleanBadPixels(darks=darks, flats=flats)
+    assert block.bad_pixels_map[5, 5] == 1
+    block.run(im)
+
+
+def test_SelectiveStack():
+    block = blocks.SelectiveStack(n=2)
+    for fwhm in (3.0, 1.0, 2.0):
+        im = image.copy()
+        im.fwhm = fwhm
+        block.run(im)
+    block.terminate()
+    assert tuple(block.stack.shape) == tuple(image.shape)
+    assert sorted(block._sigmas) == [1.0, 2.0]
+
+
 def test_Calibration_with_files(tmp_path):
     from prose.blocks import Calibration
 
@@ -265,3 +291,10 @@ def test_VideoPlot(tmp_path):
     im = image.copy()
 
     Sequence([VideoPlot(plot, tmp_path / "video.gif", fps=3)]).run([im, im, im])
+
+
+def test_sequence_n_jobs():
+    images = [image.copy() for _ in range(4)]
+    sequence = Sequence([blocks.PointSourceDetection()])
+    sequence.run(images, show_progress=False, n_jobs=2)
+    assert sequence.n_processed_images == len(images)
@@ -70,6 +70,20 @@ def test_3d():
     f.error
 
 
+def test_bin():
+    x = np.random.uniform(0, 10000, size=(3, 2, 20))
+    t = np.sort(np.random.uniform(0, 1.0, 20))
+    e = np.random.rand(3, 2, 20)
+    f = Fluxes(x, time=t, errors=e, target=0, aperture=0)
+
+    binned = f.bin(0.1)
+    assert binned.fluxes.shape[0:2] == x.shape[0:2]
+    assert binned.errors.shape == binned.fluxes.shape
+
+    binned = f.bin(5, estimate_error=True)
+    assert binned.errors.shape == binned.fluxes.shape
+
+
 def test_diff():
     x = np.random.uniform(0, 10000, size=(3, 2, 10))
     f = Fluxes(x)